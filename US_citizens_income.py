@@ -3,10 +3,15 @@ Dieses Programm ist eine Tkinter-basierte Anwendung zur Visualisierung von CSV-D
 
 Funktionalitäten:
 - Laden einer CSV-Datei über eine Dateiauswahl.
-- Auswahl eines Diagrammtyps (Balken-, Kreis-, Histogramm-, Linien-, Box- und Streudiagramme).
+- Bereinigung der Daten beim Einlesen (Platzhalter, Leerzeichen, Wertebereiche) mit Qualitätsbericht.
+- Auswahl eines Diagrammtyps (Balken-, Kreis-, Histogramm-, Linien-, Box-, Streu- und Aggregatdiagramme).
 - Auswahl von Spalten für die Diagrammerstellung.
 - Visualisierung der Daten in einem interaktiven Plotly-Graphen.
+- Animation von Balken-, Histogramm- und Boxdiagrammen über eine geordnete Spalte (z. B. age).
 - Speicherung und Anzeige der generierten Diagramme in einem Webbrowser.
+- Export der Daten hinter dem Diagramm oder der ausgewählten Spalten als CSV oder Parquet im Hintergrund.
+- Speicherung des Arbeitsstands (Daten, Diagramme, Auswahl), damit der nächste Start das letzte Diagramm sofort zeigt.
+- Rangliste der Merkmale nach ihrem Zusammenhang mit dem Einkommen (Tabelle und Heatmap).
 
 Technische Umsetzung:
 - Tkinter für die Haupt-GUI und `ttk` für die stilisierten Widgets.
@@ -35,6 +40,17 @@ import plotly.io as pio
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
 import webbrowser
+import threading
+from data_cleaning import CLEANING_VERSION, load_clean_data, report_summary
+from data_export import EXPORT_FILETYPES, export_frame
+import aggregation
+import animation
+import histogram
+from aggregation import REDUCERS, aggregate
+from animation import ANIMATED_TYPES, animated_figure, animation_table
+from histogram import histogram_table
+from income_association import pairwise_associations, salary_ranking, association_matrix
+from session_snapshot import SessionSnapshot, code_fingerprint
 
 def mapping_education(x):
     """
@@ -71,12 +87,28 @@ class PlotWindow:
     def __init__(self, root, csv_file):
         self.root = root
         self.root.title("Data Visualization App")
-        self.df = pd.read_csv(csv_file)
-        self.df["occupation"].replace("?", "Unknown", inplace=True)
-        self.df["education_level"] = self.df["education"].apply(mapping_education)
-        self.df["marital_status_summary"] = self.df["marital-status"].apply(mapping_marital_status)
+        # Bereinigte Daten werden aus dem Zwischenspeicher geladen oder beim ersten Start erzeugt
+        self.df, self.quality_report = load_clean_data(csv_file)
+
+        # Der Arbeitsstand gilt nur für dieselben Zuordnungsfunktionen, Bereinigungsregeln und Diagrammerstellung
+        # (einschließlich der Module, die die Kennzahlen der Diagramme berechnen)
+        fingerprint = code_fingerprint(mapping_education, mapping_marital_status, PlotHandler.generate_plot,
+                                       aggregation, animation, histogram, version=CLEANING_VERSION)
+        self.session = SessionSnapshot(csv_file, fingerprint)
+        derived = self.session.load_derived(len(self.df))
+        if derived is None:
+            derived = pd.DataFrame({
+                "education_level": self.df["education"].apply(mapping_education),
+                "marital_status_summary": self.df["marital-status"].apply(mapping_marital_status),
+            })
+            self.session.save_derived(derived)
+        self.df[derived.columns] = derived
+
+        # Ergebnis der Merkmals-Rangliste (pairs_df, ranking), wird nach der ersten Berechnung wiederverwendet
+        self.association_result = None
 
         self.create_layout()
+        self.restore_session()
 
     def create_layout(self):
         """Richtet das GUI-Layout mit Navigations- und Visualisierungsbereich ein."""
@@ -126,7 +158,7 @@ class PlotWindow:
     def create_widgets(self):
         """Erstellt die Widgets zur Steuerung der Anwendung."""
         # Liste der verfügbaren Diagrammtypen
-        self.plot_types = ["Bar", "Pie", "Histogram", "Line", "Box", "Scatter"]
+        self.plot_types = ["Bar", "Pie", "Histogram", "Line", "Box", "Scatter", "Aggregate"]
         # Standardmäßig ausgewählter Diagrammtyp
         self.selected_plot = tk.StringVar(value=self.plot_types[0])
         
@@ -156,11 +188,39 @@ class PlotWindow:
         # Dropdown-Menü für die Auswahl der zweiten Spalte
         self.col2_dropdown = ttk.Combobox(self.nav_frame, textvariable=self.selected_col2, values=self.all_columns)
         self.col2_dropdown.pack(pady=5)
+
+        # Label für die Auswahl der Wertespalte (nur für Aggregate-Diagramme)
+        ttk.Label(self.nav_frame, text="Select Value Column:", style="TLabel").pack(pady=5)
+        # Dropdown-Menü für die numerische Spalte, die aggregiert wird
+        numeric_columns = self.df.select_dtypes(include=['number']).columns.tolist()
+        self.selected_value_col = tk.StringVar(value=numeric_columns[0])
+        self.value_dropdown = ttk.Combobox(self.nav_frame, textvariable=self.selected_value_col, values=numeric_columns)
+        self.value_dropdown.pack(pady=5)
+
+        # Label und Dropdown-Menü für die Kennzahl (Mittelwert, Median, Summe, Perzentile)
+        ttk.Label(self.nav_frame, text="Select Aggregation:", style="TLabel").pack(pady=5)
+        self.selected_reducer = tk.StringVar(value=REDUCERS[0])
+        self.reducer_dropdown = ttk.Combobox(self.nav_frame, textvariable=self.selected_reducer, values=REDUCERS)
+        self.reducer_dropdown.pack(pady=5)
+
+        # Label und Dropdown-Menü für die Animationsspalte (nur für Bar-, Histogramm- und Boxdiagramme)
+        ttk.Label(self.nav_frame, text="Animate By:", style="TLabel").pack(pady=5)
+        self.selected_animation_col = tk.StringVar(value="---")
+        self.animation_dropdown = ttk.Combobox(self.nav_frame, textvariable=self.selected_animation_col, values=["---"] + self.all_columns)
+        self.animation_dropdown.pack(pady=5)
         
         # Button zum Erstellen des Diagramms
         self.plot_button = ttk.Button(self.nav_frame, text="Plot", style="Soft.TButton", command=self.plot_graph)
         self.plot_button.pack(pady=5)
         
+        # Button für den Export der Diagrammdaten
+        self.export_button = ttk.Button(self.nav_frame, text="Export", style="Soft.TButton", command=self.export_data)
+        self.export_button.pack(pady=5)
+
+        # Button für die Rangliste der einkommensrelevanten Merkmale
+        self.ranking_button = ttk.Button(self.nav_frame, text="Ranking", style="Soft.TButton", command=self.show_ranking)
+        self.ranking_button.pack(pady=5)
+
         # Button für eine Informationsnachricht
         self.info_button = ttk.Button(self.nav_frame, text="Info", style="Soft.TButton", command=self.show_message)
         self.info_button.pack(pady=5)
@@ -177,9 +237,9 @@ class PlotWindow:
         # Wenn der Diagrammtyp "Histogram" ist, werden nur die erste Spalte ausgeführt und die zweite Dropdown-Liste wird auf "---" gesetzt
         if plot_type == "Histogram":
             self.col2_dropdown.config(values=["---"])
-            # Wenn der Diagrammtyp "Bar" oder "Pie" ist, wird nur mit Spalten vom Datentyp 'object' 
+            # Wenn der Diagrammtyp "Bar", "Pie" oder "Aggregate" ist, wird nur mit Spalten vom Datentyp 'object' 
             # (kategorische Spalten) gearbeitet
-        elif plot_type in ["Bar", "Pie"]:
+        elif plot_type in ["Bar", "Pie", "Aggregate"]:
             # Die Spalten mit dem Datentyp 'object' (kategorische Daten) werden als Werte 
             # für die Dropdown-Menüs verwendet
             self.col1_dropdown.config(values=self.df.select_dtypes(include=['object']).columns.tolist())
@@ -199,6 +259,7 @@ class PlotWindow:
         plot_type = self.selected_plot.get()
         col1 = self.selected_col1.get()
         col2 = self.selected_col2.get()
+        animation_col = self.selected_animation_col.get()
 
         # Überprüfen der Eingaben basierend auf dem ausgewählten Diagrammtyp und den Daten
         # Überprüfung für Balkendiagramme: Beide Spalten sollten kategorisch sein
@@ -225,34 +286,116 @@ class PlotWindow:
         elif plot_type == "Box" and not (self.df[col2].dtype in ['float64', 'int64']):
             messagebox.showwarning("Warning", "For Box plots, the second column should be numerical!")
             return
+        # Überprüfung für Aggregatdiagramme: Gruppenspalten kategorisch, Wertespalte numerisch
+        # (is_string_dtype erkennt sowohl 'object'- als auch 'str'-Spalten ab pandas 3)
+        elif plot_type == "Aggregate" and not (pd.api.types.is_string_dtype(self.df[col1])
+                                               and (col2 == "---" or pd.api.types.is_string_dtype(self.df[col2]))
+                                               and pd.api.types.is_numeric_dtype(self.df[self.selected_value_col.get()])):
+            messagebox.showwarning("Warning", "For Aggregate charts, both columns should be categorical and the value column numerical!")
+            return
+
+        # Überprüfung für Animationen: Nur Balken-, Histogramm- und Boxdiagramme können animiert werden
+        if animation_col != "---" and plot_type.lower() not in ANIMATED_TYPES:
+            messagebox.showwarning("Warning", "Only Bar, Histogram and Box charts can be animated!")
+            return
+        elif animation_col != "---" and not self.df[animation_col].notna().any():
+            messagebox.showwarning("Warning", "The animation column has no values!")
+            return
 
         # Warnung, wenn die Anzahl der einzigartigen Werte zu hoch ist für Balken- oder Tortendiagramme
-        if self.df[col1].nunique() > 50 and plot_type in ["Bar", "Pie"]:
+        if self.df[col1].nunique() > 50 and plot_type in ["Bar", "Pie", "Aggregate"]:
             messagebox.showwarning("Warning", "The selected plot type may not be suitable due to too many unique values!")
 
+        # Auswahl für den Arbeitsstand (Wertespalte und Kennzahl nur bei Aggregate-Diagrammen)
+        selection = {"plot_type": plot_type, "col1": col1, "col2": col2, "value_col": None, "reducer": None,
+                     "animation_col": animation_col}
+        if plot_type == "Aggregate":
+            selection.update(value_col=self.selected_value_col.get(), reducer=self.selected_reducer.get())
+
         # Erstellen und Initialisieren des PlotHandlers entsprechend dem Diagrammtyp
+        plot_handler = self.create_plot_handler(selection)
+        if plot_handler is None:
+            messagebox.showerror("Error", "Invalid plot type selected!")
+            return
+        self.plot_handler = plot_handler
+
+        # Erstellen des Diagramms (ein bereits gespeichertes Diagramm wird wiederverwendet)
+        self.plot_handler.generate_plot(self.session.load_figure(selection))
+        if self.plot_handler.fig is not None and self.plot_handler.cache_figure():
+            self.session.save_figure(selection, self.plot_handler.fig)
+        else:
+            # Diagramme mit allen Rohdaten (z. B. Scatter) werden nicht gespeichert, nur die Auswahl
+            self.session.save_selection(selection)
+
+    def create_plot_handler(self, selection):
+        """Erstellt den PlotHandler zu einer Auswahl (oder None bei einem unbekannten Diagrammtyp)."""
+        plot_type = selection["plot_type"]
+        col1 = selection["col1"]
+        col2 = selection["col2"]
+        animation_col = selection.get("animation_col", "---")
+
         if plot_type == "Bar":
-            self.plot_handler = PlotHandler(self.df, "bar", col1, col2)
+            return PlotHandler(self.df, "bar", col1, col2, animation_col=animation_col)
         elif plot_type == "Pie":
-            self.plot_handler = PlotHandler(self.df, "pie", col1, col2)
+            return PlotHandler(self.df, "pie", col1, col2)
         elif plot_type == "Histogram":
-            self.plot_handler = PlotHandler(self.df, "histogram", col1, None)
+            return PlotHandler(self.df, "histogram", col1, None, animation_col=animation_col)
         elif plot_type == "Line":
-            self.plot_handler = PlotHandler(self.df, "line", col1, col2)
+            return PlotHandler(self.df, "line", col1, col2)
         elif plot_type == "Box":
-            self.plot_handler = PlotHandler(self.df, "box", col1, col2)
+            return PlotHandler(self.df, "box", col1, col2, animation_col=animation_col)
         elif plot_type == "Scatter":
-            self.plot_handler = PlotHandler(self.df, "scatter", col1, col2)
-        else:
-            messagebox.showerror("Error", "Invalid plot type selected!")
+            return PlotHandler(self.df, "scatter", col1, col2)
+        elif plot_type == "Aggregate":
+            return PlotHandler(self.df, "aggregate", col1, col2,
+                               value_col=selection["value_col"], reducer=selection["reducer"])
+        return None
+
+    def restore_session(self):
+        """Stellt die letzte Auswahl wieder her und zeigt das zuletzt erstellte Diagramm sofort an."""
+        selection = self.session.last_selection()
+        if selection is None:
             return
 
-        # Erstellen des Diagramms
-        self.plot_handler.generate_plot()
+        self.selected_plot.set(selection["plot_type"])
+        self.selected_col1.set(selection["col1"])
+        self.selected_col2.set(selection["col2"])
+        self.selected_animation_col.set(selection.get("animation_col", "---"))
+        if selection["value_col"] is not None:
+            self.selected_value_col.set(selection["value_col"])
+            self.selected_reducer.set(selection["reducer"])
+        self.update_column_dropdown()
+
+        fig = self.session.load_figure(selection)
+        if fig is not None:
+            # PlotHandler mit dem gespeicherten Diagramm, damit der Export sofort möglich ist
+            self.plot_handler = self.create_plot_handler(selection)
+            self.plot_handler.fig = fig
+            fig.write_html("plot.html")
+            webbrowser.open("plot.html")
 
         # Anzeige einer Informationsnachricht
     def show_message(self):
-        MessageBoxHandler(self.df)
+        MessageBoxHandler(self.df, self.quality_report)
+
+    def export_data(self):
+        """Exportiert die Daten des zuletzt erstellten Diagramms."""
+        if getattr(self, "plot_handler", None) is None:
+            messagebox.showwarning("Warning", "Please create a plot before exporting!")
+            return
+        ExportHandler(self.root, self.plot_handler)
+
+    def show_ranking(self):
+        """Zeigt die Rangliste der Merkmale nach ihrem Zusammenhang mit dem Einkommen an."""
+        # Während der Berechnung wird der Button deaktiviert, damit sie nicht mehrfach startet
+        self.ranking_button.state(["disabled"])
+        RankingHandler(self.root, self.df, result=self.association_result, on_done=self.store_ranking)
+
+    def store_ranking(self, result):
+        """Speichert das Ergebnis der Rangliste (None bei einem Fehler) und aktiviert den Button wieder."""
+        if result is not None:
+            self.association_result = result
+        self.ranking_button.state(["!disabled"])
 
 
 
@@ -270,13 +413,26 @@ class PlotHandler:
         Die erste ausgewählte Spalte für die Diagrammerstellung.
     col2 : str
         Die zweite ausgewählte Spalte (falls benötigt, sonst "---").
+    value_col : str
+        Die numerische Spalte, die bei "aggregate" zusammengefasst wird.
+    reducer : str
+        Die Kennzahl für "aggregate" (z. B. "mean", "median", "sum", "p90").
+    animation_col : str
+        Die geordnete Spalte, über die "bar", "histogram" oder "box" animiert wird (sonst "---").
 
     Methoden:
     ---------
-    generate_plot():
+    generate_plot(fig=None):
         Erstellt ein Diagramm basierend auf den ausgewählten Parametern und zeigt es an.
+        Ein übergebenes, bereits erstelltes Diagramm wird direkt angezeigt.
+    cache_figure():
+        Gibt zurück, ob das Diagramm im Arbeitsstand gespeichert werden soll.
+    chart_table():
+        Gibt die Tabelle mit den Zahlen hinter dem Diagramm zurück.
+    selected_subset():
+        Gibt die Rohdaten der ausgewählten Spalten zurück.
     """
-    def __init__(self, df, plot_type, col1, col2):
+    def __init__(self, df, plot_type, col1, col2, value_col=None, reducer=None, animation_col="---"):
         """
         Initialisiert den PlotHandler mit den übergebenen Parametern.
         """
@@ -288,24 +444,44 @@ class PlotHandler:
         self.col1 = col1
         # Die zweite Spalte für das Diagramm (oder "---", falls nicht benötigt)
         self.col2 = col2
-
-    def generate_plot(self):
+        # Die aggregierte Spalte und die Kennzahl (nur für Aggregate-Diagramme)
+        self.value_col = value_col
+        self.reducer = reducer
+        # Die Spalte für die Animation (oder "---", falls keine Animation gewünscht ist)
+        self.animation_col = animation_col
+        # Das zuletzt erstellte Diagramm (None, solange keines erstellt wurde)
+        self.fig = None
+
+    def generate_plot(self, fig=None):
         """
         Erstellt und zeigt ein Diagramm basierend auf den ausgewählten Parametern.
 
         Der Diagrammtyp wird basierend auf der Benutzerauswahl erstellt. Es werden 
         verschiedene Diagrammtypen unterstützt, einschließlich Bar, Pie, Histogramm,
-        Line, Box und Scatter. Alle Diagramme erhalten einen Titel und eine 
+        Line, Box, Scatter und Aggregate. Alle Diagramme erhalten einen Titel und eine 
         angepasste Formatierung.
 
         Wenn der Diagrammtyp oder die Spaltenkombination nicht geeignet ist, wird
         eine Fehlermeldung angezeigt.
+
+        Wird ein bereits erstelltes Diagramm (z. B. aus dem gespeicherten Arbeitsstand)
+        übergeben, wird es ohne Neuberechnung angezeigt.
         """
         plot_title = f"{self.plot_type} plot of {self.col1} and {self.col2}".title()
         title_style = dict(font=dict(size=20, color="blue", family="Arial", weight="bold"))
 
+        # Gespeichertes Diagramm verwenden, anstatt es neu zu berechnen
+        if fig is not None:
+            pass
+
+        # Erstellen eines animierten Diagramms aus vorberechneten Kennzahlen je Animationsschritt
+        elif self.animation_col not in (None, "---") and self.plot_type in ANIMATED_TYPES:
+            fig = animated_figure(self.df, self.plot_type, self.col1, self.col2, self.animation_col)
+            plot_title = f"{self.plot_type} plot of {self.col1} and {self.col2} by {self.animation_col}".title()
+            fig.update_layout(title=plot_title, title_font=dict(size=20, color="blue", family="Arial", weight="bold"))
+
         # Erstellen eines Bar-Diagramms
-        if self.plot_type == "bar":
+        elif self.plot_type == "bar":
             if self.col2 == "---":  # Wenn keine zweite Spalte ausgewählt ist
                 count_df = self.df[self.col1].value_counts().reset_index(name="Count")
                 fig = px.bar(count_df, x="index", y="Count")
@@ -334,7 +510,10 @@ class PlotHandler:
 
         # Erstellen eines Histogramms
         elif self.plot_type == "histogram":
-            fig = px.histogram(self.df, x=self.col1, color=self.col2 if self.col2 != "---" else None)
+            # Die Klassen werden selbst berechnet, damit der Export dieselben Zahlen enthält
+            table = histogram_table(self.df[self.col1])
+            fig = px.bar(x=(table["bin_left"] + table["bin_right"]) / 2, y=table["Count"], labels={"x": self.col1, "y": "Count"})
+            fig.update_traces(width=table["bin_right"] - table["bin_left"])
             fig.update_layout(title=plot_title, title_font=dict(size=20, color="blue", family="Arial", weight="bold"))
 
         # Erstellen eines Liniendiagramms
@@ -352,10 +531,19 @@ class PlotHandler:
             fig = px.scatter(self.df, x=self.col1, y=self.col2)
             fig.update_layout(title=plot_title, title_font=dict(size=20, color="blue", family="Arial", weight="bold"))
 
+        # Erstellen eines Aggregat-Diagramms (Kennzahl einer numerischen Spalte je Kategorie)
+        elif self.plot_type == "aggregate":
+            group_cols = [self.col1] if self.col2 in ("---", self.col1) else [self.col1, self.col2]
+            agg_df = aggregate(self.df, self.value_col, group_cols, self.reducer)
+            fig = px.bar(agg_df, x=self.col1, y=self.value_col, color=self.col2 if self.col2 != "---" else None, barmode="group")
+            plot_title = f"{self.reducer} of {self.value_col} by {' and '.join(group_cols)}".title()
+            fig.update_layout(title=plot_title, title_font=dict(size=20, color="blue", family="Arial", weight="bold"))
+
          # Fehlerbehandlung bei ungültigem Diagrammtyp
         else:
             messagebox.showerror("Error", "Invalid plot type selected!")
             return
+        self.fig = fig
         
         # Speichern und Öffnen des Diagramms
         fig.write_html("plot.html")
@@ -399,6 +587,47 @@ class PlotHandler:
         else:
             messagebox.showwarning("Warning", "No directory selected. Plot not saved.")"""
 
+    def cache_figure(self):
+        """
+        Gibt zurück, ob das Diagramm im Arbeitsstand gespeichert werden soll.
+
+        Nur Diagramme aus vorberechneten Kennzahlen (Häufigkeiten, Aggregate, Animationsschritte)
+        sind klein genug; Line, Scatter und Box enthalten alle Zeilen des Datensatzes.
+        """
+        if self.animation_col not in (None, "---") and self.plot_type in ANIMATED_TYPES:
+            return True
+        return self.plot_type in ["bar", "pie", "histogram", "aggregate"]
+
+    def chart_table(self):
+        """
+        Gibt die Tabelle mit den Zahlen hinter dem Diagramm zurück:
+        - Bar, Pie: Anzahl der Zeilen je Kombination der ausgewählten Spalten
+        - Histogram: Klassengrenzen und Anzahl je Klasse (wie im Diagramm)
+        - Aggregate: die gewählte Kennzahl je Kategorie
+        - Box: Kennzahlen (count, mean, Quartile, ...) der zweiten Spalte je Kategorie
+        - Line, Scatter: die Wertepaare der beiden Spalten
+        - Animierte Diagramme: dieselben Zahlen je Animationsschritt
+        """
+        if self.animation_col not in (None, "---") and self.plot_type in ANIMATED_TYPES:
+            # Gruppiert nach denselben Animationsschritten wie das Diagramm (z. B. Altersbereiche)
+            return animation_table(self.df, self.plot_type, self.col1, self.col2, self.animation_col)
+        if self.plot_type == "histogram":
+            return histogram_table(self.df[self.col1])
+        if self.plot_type in ["bar", "pie"]:
+            group_cols = [col for col in [self.col1, self.col2] if col not in (None, "---")]
+            return self.df.groupby(list(dict.fromkeys(group_cols))).size().reset_index(name="Count")
+        if self.plot_type == "aggregate":
+            group_cols = [self.col1] if self.col2 in ("---", self.col1) else [self.col1, self.col2]
+            return aggregate(self.df, self.value_col, group_cols, self.reducer)
+        if self.plot_type == "box":
+            return self.df.groupby(self.col1)[self.col2].describe().reset_index()
+        return self.selected_subset()
+
+    def selected_subset(self):
+        """Gibt die Rohdaten aller für das Diagramm ausgewählten Spalten zurück."""
+        columns = [self.col1, self.col2, self.value_col, self.animation_col]
+        return self.df[list(dict.fromkeys(col for col in columns if col not in (None, "---")))]
+
 
 class MessageBoxHandler:
     """
@@ -408,9 +637,11 @@ class MessageBoxHandler:
     ---------
     show_info(): Zeigt die Informationen des Datensatzes an, einschließlich der Anzahl der Zeilen, Spalten und fehlenden Werte.
     """
-    def __init__(self, df):
+    def __init__(self, df, quality_report=None):
         # Der DataFrame wird als Argument übergeben
         self.df = df
+        # Qualitätsbericht der Bereinigung beim Einlesen (optional)
+        self.quality_report = quality_report
         # Ruft die Methode zur Anzeige der Datensatzinformationen au
         self.show_info()
 
@@ -420,11 +651,163 @@ class MessageBoxHandler:
         - Anzahl der Zeilen
         - Anzahl der Spalten
         - Anzahl der fehlenden Werte
+        - Zusammenfassung des Qualitätsberichts (falls vorhanden)
         """
         info_text = f"Dataset Info:\nRows: {self.df.shape[0]}\nColumns: {self.df.shape[1]}\nMissing Values: {self.df.isnull().sum().sum()}"
+        if self.quality_report is not None:
+            info_text += f"\n\nCleaned At Load:\n{report_summary(self.quality_report)}"
         # Zeigt das Info-Fenster mit den Daten an
         messagebox.showinfo("Dataset Information", info_text)
 
+class RankingHandler:
+    """
+    Diese Klasse zeigt, welche Merkmale am stärksten mit dem Einkommen zusammenhängen.
+
+    Methoden:
+    ---------
+    run_ranking(): Berechnet alle Spaltenpaare und die Rangliste (läuft im Hintergrund-Thread).
+    check_progress(): Prüft, ob die Berechnung fertig ist, und zeigt dann das Ergebnis an.
+    show_table(): Zeigt die Rangliste aller Merkmale gegenüber "salary" in einem eigenen Fenster an.
+    show_heatmap(): Zeigt Cramér's V für alle Spaltenpaare als Heatmap im Webbrowser an.
+    """
+    def __init__(self, root, df, target="salary", result=None, on_done=None):
+        self.root = root
+        self.df = df
+        self.target = target
+        # Wird mit (pairs_df, ranking) bzw. None bei einem Fehler aufgerufen
+        self.on_done = on_done
+        self.error = None
+
+        # Ein bereits berechnetes Ergebnis wird sofort angezeigt
+        if result is not None:
+            self.pairs_df, self.ranking = result
+            self.finish()
+            return
+
+        # Die Berechnung läuft in einem eigenen Thread, damit die GUI bedienbar bleibt
+        self.root.title("Data Visualization App - Computing feature ranking ...")
+        self.thread = threading.Thread(target=self.run_ranking, daemon=True)
+        self.thread.start()
+        self.check_progress()
+
+    def run_ranking(self):
+        """Berechnet alle Spaltenpaare einmal und verwendet sie für Tabelle und Heatmap."""
+        try:
+            self.pairs_df = pairwise_associations(self.df)
+            self.ranking = salary_ranking(self.df, target=self.target, pairs_df=self.pairs_df)
+        except Exception as e:
+            self.error = e
+
+    def check_progress(self):
+        """Prüft alle 200 ms, ob die Berechnung fertig ist; Tkinter wird nur aus dem Hauptthread verwendet."""
+        if self.thread.is_alive():
+            self.root.after(200, self.check_progress)
+            return
+
+        self.root.title("Data Visualization App")
+        if self.error is not None:
+            if self.on_done is not None:
+                self.on_done(None)
+            messagebox.showerror("Error", f"Failed to compute feature ranking: {self.error}")
+            return
+        self.finish()
+
+    def finish(self):
+        """Gibt das Ergebnis zurück und zeigt Tabelle und Heatmap an."""
+        if self.on_done is not None:
+            self.on_done((self.pairs_df, self.ranking))
+        self.show_table()
+        self.show_heatmap()
+
+    def show_table(self):
+        """
+        Zeigt die Rangliste in einer Tabelle an:
+        - Chi-Quadrat, Cramér's V und Mutual Information für alle Merkmale
+        - Punktbiseriale Korrelation für numerische Merkmale
+        """
+        window = tk.Toplevel(self.root)
+        window.title(f"Feature Ranking vs. {self.target}")
+
+        columns = ["feature", "chi2", "cramers_v", "mutual_info", "point_biserial"]
+        tree = ttk.Treeview(window, columns=columns, show="headings", height=len(self.ranking))
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=140, anchor=tk.CENTER)
+
+        for row in self.ranking.itertuples(index=False):
+            # Für kategorische Merkmale gibt es keine punktbiseriale Korrelation
+            biserial = "---" if pd.isna(row.point_biserial) else f"{row.point_biserial:.3f}"
+            tree.insert("", tk.END, values=(row.feature, f"{row.chi2:.1f}", f"{row.cramers_v:.3f}", f"{row.mutual_info:.3f}", biserial))
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def show_heatmap(self):
+        """Erstellt eine Heatmap aus Cramér's V aller Spaltenpaare und öffnet sie im Webbrowser."""
+        matrix = association_matrix(self.pairs_df)
+        fig = px.imshow(matrix, color_continuous_scale="Blues", zmin=0, zmax=1, text_auto=".2f")
+        fig.update_layout(title="Cramér's V Of All Column Pairs", title_font=dict(size=20, color="blue", family="Arial", weight="bold"))
+        fig.write_html("association.html")
+        webbrowser.open("association.html")
+
+class ExportHandler:
+    """
+    Diese Klasse exportiert die Daten hinter einem Diagramm als CSV oder Parquet im Hintergrund.
+
+    Methoden:
+    ---------
+    start_export(): Fragt Datenquelle und Zieldatei ab und startet den Export in einem Hintergrund-Thread.
+    run_export(): Erstellt die Tabelle und schreibt sie blockweise in die Datei (läuft im Thread).
+    check_progress(): Zeigt den Fortschritt im Fenstertitel an und meldet das Ergebnis.
+    """
+    def __init__(self, root, plot_handler):
+        self.root = root
+        self.plot_handler = plot_handler
+        # Fortschritt (geschriebene Zeilen, Gesamtzeilen) und Fehler werden vom Thread gesetzt
+        self.progress = (0, 0)
+        self.error = None
+        self.start_export()
+
+    def start_export(self):
+        """Fragt ab, was exportiert werden soll, und startet den Export."""
+        use_table = messagebox.askyesnocancel(
+            "Export", "Export the aggregate table behind the chart?\n(No = raw data of the selected columns)"
+        )
+        if use_table is None:
+            return
+        self.file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=EXPORT_FILETYPES)
+        if not self.file_path:
+            return
+
+        # Der Export läuft in einem eigenen Thread, damit die GUI bedienbar bleibt
+        self.thread = threading.Thread(target=self.run_export, args=(use_table,), daemon=True)
+        self.thread.start()
+        self.check_progress()
+
+    def run_export(self, use_table):
+        """Erstellt die Tabelle und schreibt sie blockweise in die gewählte Datei."""
+        try:
+            df = self.plot_handler.chart_table() if use_table else self.plot_handler.selected_subset()
+            export_frame(df, self.file_path, progress=self.update_progress)
+        except Exception as e:
+            self.error = e
+
+    def update_progress(self, written, total):
+        """Speichert den Fortschritt (wird nach jedem Block aus dem Thread aufgerufen)."""
+        self.progress = (written, total)
+
+    def check_progress(self):
+        """Prüft alle 200 ms, ob der Export fertig ist; Tkinter wird nur aus dem Hauptthread verwendet."""
+        if self.thread.is_alive():
+            written, total = self.progress
+            self.root.title(f"Data Visualization App - Exporting {written}/{total} rows")
+            self.root.after(200, self.check_progress)
+            return
+
+        self.root.title("Data Visualization App")
+        if self.error is not None:
+            messagebox.showerror("Error", f"Failed to export data: {self.error}")
+        else:
+            messagebox.showinfo("Success", f"Data exported as {self.file_path}")
+
 # Der Hauptcode, um die Anwendung zu starten
 if __name__ == "__main__":
     root = tk.Tk()  # Erstellt das Haupt-Tkinter-Fenster
@@ -0,0 +1,95 @@
+"""
+Aggregation einer numerischen Spalte nach einer oder mehreren kategorischen Spalten.
+
+Funktionalitäten:
+- Kennzahlen: Mittelwert, Median, Summe, Anzahl und Perzentile (p25, p75, p90).
+- Partitioniertes Group-by auf mehreren Prozessen für große Datensätze:
+    Summe, Anzahl und Mittelwert werden pro Zeilenblock als Teilergebnis (Summe, Anzahl)
+    berechnet und danach zusammengeführt.
+    Median und Perzentile werden über einen Hash der Gruppenschlüssel partitioniert, sodass
+    jede Gruppe vollständig in einer Partition liegt und exakt berechnet werden kann.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Verfügbare Kennzahlen für den Diagrammtyp "Aggregate"
+REDUCERS = ["mean", "median", "sum", "count", "p25", "p75", "p90"]
+
+# Ab dieser Zeilenanzahl wird auf mehrere Prozesse verteilt
+PARALLEL_ROWS = 2_000_000
+
+
+def _quantile(reducer):
+    """Gibt das Quantil zu einer Perzentil-Kennzahl zurück (z. B. "p90" -> 0.9), sonst None."""
+    if reducer == "median":
+        return 0.5
+    if reducer.startswith("p"):
+        return int(reducer[1:]) / 100
+    return None
+
+
+def _partial_sums(args):
+    """Berechnet Summe und Anzahl je Gruppe für einen Zeilenblock (läuft im Worker)."""
+    chunk, group_cols, value_col = args
+    return chunk.groupby(group_cols, observed=True)[value_col].agg(["sum", "count"])
+
+
+def _partition_quantile(args):
+    """Berechnet das Quantil je Gruppe für eine Partition mit vollständigen Gruppen (läuft im Worker)."""
+    partition, group_cols, value_col, q = args
+    return partition.groupby(group_cols, observed=True)[value_col].quantile(q)
+
+
+def _split_rows(df, parts):
+    """Teilt den DataFrame in gleich große Zeilenblöcke."""
+    bounds = np.linspace(0, len(df), parts + 1, dtype=np.int64)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _split_by_key(df, group_cols, parts):
+    """Teilt den DataFrame anhand eines Hashs der Gruppenschlüssel, sodass keine Gruppe geteilt wird."""
+    partition_ids = pd.util.hash_pandas_object(df[group_cols], index=False).to_numpy() % parts
+    return [df[partition_ids == k] for k in range(parts)]
+
+
+def aggregate(df, value_col, group_cols, reducer="mean", max_workers=None):
+    """
+    Aggregiert `value_col` je Kombination der Spalten in `group_cols` mit der gewählten Kennzahl.
+
+    Rückgabe: DataFrame mit den Gruppenspalten und der aggregierten Spalte `value_col`.
+    """
+    if reducer not in REDUCERS:
+        raise ValueError(f"Unknown reducer: {reducer}")
+    # Doppelte Gruppenspalten (z. B. zweimal "sex") nur einmal verwenden
+    group_cols = list(dict.fromkeys(group_cols))
+    data = df[group_cols + [value_col]].dropna()
+    workers = max_workers or os.cpu_count() or 1
+    parallel = workers > 1 and len(data) >= PARALLEL_ROWS
+    q = _quantile(reducer)
+
+    if q is not None:
+        if parallel:
+            tasks = [(part, group_cols, value_col, q) for part in _split_by_key(data, group_cols, workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                result = pd.concat(pool.map(_partition_quantile, tasks)).sort_index()
+        else:
+            result = _partition_quantile((data, group_cols, value_col, q))
+    else:
+        if parallel:
+            tasks = [(chunk, group_cols, value_col) for chunk in _split_rows(data, workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                partials = pd.concat(pool.map(_partial_sums, tasks))
+            # Teilergebnisse der Blöcke zusammenführen
+            totals = partials.groupby(level=list(range(len(group_cols)))).sum()
+        else:
+            totals = _partial_sums((data, group_cols, value_col))
+        if reducer == "mean":
+            result = totals["sum"] / totals["count"]
+        else:
+            result = totals[reducer]
+
+    return result.rename(value_col).reset_index()
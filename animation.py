@@ -0,0 +1,217 @@
+"""
+Animierte Diagramme (Bar, Histogram, Box) über eine geordnete Spalte, z. B. Altersgruppen oder education-num.
+
+Anstatt px.*(..., animation_frame=...) auf alle Zeilen anzuwenden, werden die Kennzahlen aller
+Animationsschritte in einem einzigen gruppierten Durchlauf berechnet:
+- Bar und Histogram: Häufigkeiten je (Schritt, Kategorie bzw. Klasse, Farbe) über ein np.bincount.
+- Box: Minimum, Quartile und Maximum je (Schritt, Kategorie) über ein groupby-quantile.
+
+Die Achsenbeschriftungen stehen nur einmal im Grunddiagramm. Jeder Animationsschritt enthält
+nur die sich ändernden Zahlenreihen, dadurch bleibt die HTML-Datei klein.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from histogram import histogram_codes
+
+# Diagrammtypen, die animiert werden können
+ANIMATED_TYPES = ["bar", "histogram", "box"]
+
+# Numerische Spalten mit mehr als MAX_DISTINCT_FRAMES Werten werden in FRAME_BANDS Bereiche eingeteilt
+MAX_DISTINCT_FRAMES = 20
+FRAME_BANDS = 10
+
+def frame_codes(series):
+    """
+    Ordnet jede Zeile einem Animationsschritt zu (fehlende Werte = -1).
+
+    Numerische Spalten mit mehr als MAX_DISTINCT_FRAMES Werten (z. B. age) werden in
+    FRAME_BANDS gleich breite Bereiche eingeteilt, sonst entspricht jeder Wert einem Schritt.
+
+    Rückgabe: (codes, labels) mit eindeutigen Beschriftungen in aufsteigender Reihenfolge
+    (Plotly findet die Animationsschritte über ihren Namen).
+    """
+    if pd.api.types.is_numeric_dtype(series) and series.nunique() > MAX_DISTINCT_FRAMES:
+        bands = pd.cut(series, bins=FRAME_BANDS)
+        # pd.cut erweitert die erste Grenze leicht nach unten, angezeigt wird das Minimum
+        edges = [series.min()] + [band.right for band in bands.cat.categories]
+        return bands.cat.codes.to_numpy(), _band_labels(edges)
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes, [str(value) for value in uniques]
+
+
+def _band_labels(edges):
+    """
+    Beschriftet die Bereiche zwischen den Grenzen mit so vielen Nachkommastellen, dass jede
+    Beschriftung eindeutig ist (z. B. "17 - 24" für age, "0.30 - 0.60" für schmale Bereiche).
+    """
+    for decimals in range(7):
+        labels = [f"{left:.{decimals}f} - {right:.{decimals}f}" for left, right in zip(edges[:-1], edges[1:])]
+        if len(set(labels)) == len(labels):
+            return labels
+    # Sicherheitsnetz: laufende Nummer voranstellen
+    return [f"{i + 1}: {label}" for i, label in enumerate(labels)]
+
+
+def _value_range(values):
+    """Gibt (Minimum, Maximum) für die y-Achse zurück; bei leeren Daten (0, 1)."""
+    if values.size == 0 or np.all(np.isnan(values)):
+        return 0, 1
+    return min(0, np.nanmin(values)), max(np.nanmax(values), 1)
+
+
+def _count_cube(frames, x_codes, color_codes, n_frames, n_x, n_color):
+    """Zählt die Zeilen je (Schritt, x, Farbe) mit einem einzigen bincount."""
+    mask = (frames >= 0) & (x_codes >= 0) & (color_codes >= 0)
+    flat = (frames[mask].astype(np.int64) * n_x + x_codes[mask]) * n_color + color_codes[mask]
+    return np.bincount(flat, minlength=n_frames * n_x * n_color).reshape(n_frames, n_x, n_color)
+
+
+def _count_data(df, plot_type, col1, col2, frames, n_frames):
+    """
+    Zählt die Zeilen je (Schritt, Kategorie bzw. Klasse, Farbe) für Bar- und Histogramm-Diagramme.
+
+    Rückgabe: (counts, x_values, color_names, edges); edges nur beim Histogramm, sonst None.
+    """
+    if plot_type == "histogram":
+        x_codes, edges = histogram_codes(df[col1])
+        x_values = (edges[:-1] + edges[1:]) / 2
+    else:
+        x_codes, x_values = pd.factorize(df[col1], sort=True)
+        x_values = [str(value) for value in x_values]
+        edges = None
+
+    if col2 in (None, "---"):
+        color_codes = np.zeros(len(df), dtype=np.int64)
+        color_names = [None]
+    else:
+        color_codes, color_names = pd.factorize(df[col2], sort=True)
+        color_names = [str(name) for name in color_names]
+
+    counts = _count_cube(frames, x_codes, color_codes, n_frames, len(x_values), len(color_names))
+    return counts, x_values, color_names, edges
+
+
+def _count_figure(df, plot_type, col1, col2, frames, n_frames):
+    """Erstellt Grunddiagramm und Schritte für animierte Bar- und Histogramm-Diagramme."""
+    counts, x_values, color_names, edges = _count_data(df, plot_type, col1, col2, frames, n_frames)
+    bar_width = None if edges is None else edges[1:] - edges[:-1]
+    traces = [go.Bar(x=x_values, y=counts[0, :, c], name=name, width=bar_width) for c, name in enumerate(color_names)]
+    frame_data = [[go.Bar(y=counts[f, :, c]) for c in range(len(color_names))] for f in range(n_frames)]
+    return traces, frame_data, _value_range(counts.astype(np.float64))
+
+
+def _box_data(df, col1, col2, frames, n_frames):
+    """
+    Berechnet Minimum, Quartile und Maximum je (Schritt, Kategorie) für Box-Diagramme.
+
+    Rückgabe: (cube, x_values) mit cube der Form (Schritte, Kategorien, 5).
+    """
+    x_codes, x_values = pd.factorize(df[col1], sort=True)
+    x_values = [str(value) for value in x_values]
+
+    valid = (frames >= 0) & (x_codes >= 0)
+    values = df[col2].to_numpy()[valid]
+    stats = (
+        pd.Series(values)
+        .groupby([frames[valid], x_codes[valid]])
+        .quantile([0, 0.25, 0.5, 0.75, 1])
+        .unstack()
+    )
+    # Auf das vollständige Raster (Schritt x Kategorie) bringen, fehlende Kombinationen bleiben leer
+    grid = pd.MultiIndex.from_product([range(n_frames), range(len(x_values))])
+    cube = stats.reindex(grid).to_numpy().reshape(n_frames, len(x_values), 5)
+    return cube, x_values
+
+
+def _box_figure(df, col1, col2, frames, n_frames):
+    """Erstellt Grunddiagramm und Schritte für animierte Box-Diagramme aus vorberechneten Quartilen."""
+    cube, x_values = _box_data(df, col1, col2, frames, n_frames)
+
+    def box(f):
+        return dict(lowerfence=cube[f, :, 0], q1=cube[f, :, 1], median=cube[f, :, 2], q3=cube[f, :, 3], upperfence=cube[f, :, 4])
+
+    traces = [go.Box(x=x_values, name=col2, **box(0))]
+    frame_data = [[go.Box(**box(f))] for f in range(n_frames)]
+    return traces, frame_data, _value_range(cube)
+
+
+def animation_table(df, plot_type, col1, col2, animation_col):
+    """
+    Gibt die Zahlen eines animierten Diagramms als Tabelle zurück, genau wie sie angezeigt werden
+    (gruppiert nach den Animationsschritten aus frame_codes, z. B. Altersbereichen).
+
+    Rückgabe: DataFrame mit der Animationsspalte und
+    - Bar: col1, (col2) und "Count",
+    - Histogram: "bin_left", "bin_right" und "Count",
+    - Box: col1 und "min", "q1", "median", "q3", "max" von col2.
+    """
+    if plot_type not in ANIMATED_TYPES:
+        raise ValueError(f"Plot type cannot be animated: {plot_type}")
+    frames, labels = frame_codes(df[animation_col])
+    labels = np.asarray(labels, dtype=object)
+
+    if plot_type == "box":
+        cube, x_values = _box_data(df, col1, col2, frames, len(labels))
+        frame_idx, x_idx = np.indices(cube.shape[:2]).reshape(2, -1)
+        table = pd.DataFrame(cube.reshape(-1, 5), columns=["min", "q1", "median", "q3", "max"])
+        table.insert(0, col1, np.asarray(x_values, dtype=object)[x_idx])
+    else:
+        counts, x_values, color_names, edges = _count_data(df, plot_type, col1, col2, frames, len(labels))
+        frame_idx, x_idx, color_idx = np.indices(counts.shape).reshape(3, -1)
+        if edges is None:
+            table = pd.DataFrame({col1: np.asarray(x_values, dtype=object)[x_idx]})
+        else:
+            table = pd.DataFrame({"bin_left": edges[:-1][x_idx], "bin_right": edges[1:][x_idx]})
+        if color_names != [None]:
+            table[col2] = np.asarray(color_names, dtype=object)[color_idx]
+        table["Count"] = counts.reshape(-1)
+
+    table.insert(0, animation_col, labels[frame_idx])
+    return table
+
+
+def animated_figure(df, plot_type, col1, col2, animation_col):
+    """
+    Erstellt ein animiertes Bar-, Histogramm- oder Box-Diagramm über die Spalte `animation_col`.
+
+    Rückgabe: plotly.graph_objects.Figure mit Play-/Pause-Buttons und Schieberegler.
+    """
+    if plot_type not in ANIMATED_TYPES:
+        raise ValueError(f"Plot type cannot be animated: {plot_type}")
+    frames, labels = frame_codes(df[animation_col])
+    if not labels:
+        raise ValueError(f"Column has no values to animate: {animation_col}")
+
+    if plot_type == "box":
+        traces, frame_data, y_range = _box_figure(df, col1, col2, frames, len(labels))
+    else:
+        traces, frame_data, y_range = _count_figure(df, plot_type, col1, col2, frames, len(labels))
+
+    fig = go.Figure(
+        data=traces,
+        frames=[go.Frame(name=label, data=data, traces=list(range(len(traces)))) for label, data in zip(labels, frame_data)],
+    )
+    # Feste y-Achse, damit die Schritte vergleichbar sind
+    fig.update_yaxes(range=[y_range[0], y_range[1] * 1.05])
+    fig.update_layout(
+        barmode="group",
+        updatemenus=[dict(
+            type="buttons",
+            buttons=[
+                dict(label="Play", method="animate",
+                     args=[None, {"frame": {"duration": 700, "redraw": True}, "fromcurrent": True}]),
+                dict(label="Pause", method="animate",
+                     args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}]),
+            ],
+        )],
+        sliders=[dict(
+            currentvalue={"prefix": f"{animation_col}: "},
+            steps=[dict(label=label, method="animate",
+                        args=[[label], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}])
+                   for label in labels],
+        )],
+    )
+    return fig
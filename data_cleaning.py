@@ -0,0 +1,240 @@
+"""
+Bereinigung des Census Income Datasets beim Einlesen der CSV-Datei.
+
+Funktionalitäten:
+- Erkennung von Platzhaltern (z. B. "?") in allen kategorischen Spalten, die als fehlende Werte gesetzt werden.
+- Entfernen von überflüssigen Leerzeichen.
+- Vereinheitlichung von Kategorien, die sich nur in Groß-/Kleinschreibung unterscheiden.
+- Prüfung der numerischen Spalten auf gültige Wertebereiche.
+- Qualitätsbericht mit der Anzahl der gefundenen Probleme je Spalte.
+- Zwischenspeicherung der bereinigten Daten und des Berichts, damit die Prüfung nur einmal läuft.
+
+Die Prüfungen laufen auf den eindeutigen Werten jeder Spalte (pd.factorize) und nicht auf jeder Zeile.
+Große Dateien werden in Blöcken eingelesen und parallel bereinigt.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Werte, die im Datensatz für "unbekannt" stehen
+PLACEHOLDER_TOKENS = {"?", "", "NA", "N/A", "n/a", "null", "NULL", "None", "-"}
+
+# Gültige Wertebereiche der numerischen Spalten (None = keine Grenze)
+NUMERIC_RANGES = {
+    "age": (0, 120),
+    "fnlwgt": (0, None),
+    "education-num": (1, 16),
+    "capital-gain": (0, None),
+    "capital-loss": (0, None),
+    "hours-per-week": (1, 99),
+}
+
+# Ab dieser Dateigröße wird blockweise und parallel eingelesen
+CHUNK_FILE_SIZE = 200 * 1024 * 1024
+CHUNK_ROWS = 1_000_000
+
+# Wird erhöht, wenn sich die Bereinigungsregeln ändern; ältere Zwischenspeicher werden dann verworfen
+CLEANING_VERSION = 2
+
+ISSUE_KEYS = ["placeholders", "whitespace", "out_of_range", "merged_categories", "missing"]
+
+
+def _empty_report(columns):
+    """Erstellt einen Bericht mit 0 Problemen für jede Spalte."""
+    return {col: dict.fromkeys(ISSUE_KEYS, 0) for col in columns}
+
+
+def _merge_reports(reports):
+    """Addiert die Teilberichte mehrerer Blöcke."""
+    merged = _empty_report(reports[0])
+    for report in reports:
+        for col, counts in report.items():
+            for key, value in counts.items():
+                merged[col][key] += value
+    return merged
+
+
+def _text_columns(df):
+    """Gibt die kategorischen (Text-)Spalten des DataFrames zurück."""
+    return df.select_dtypes(include=["object", "string"]).columns
+
+
+def clean_chunk(df):
+    """
+    Bereinigt einen DataFrame (oder einen Block davon) und zählt die gefundenen Probleme.
+
+    - Leerzeichen am Anfang/Ende werden entfernt.
+    - Platzhalter werden zu fehlenden Werten.
+    - Textspalten, deren übrige Werte alle Zahlen sind (z. B. age mit "?"), werden numerisch.
+    - Numerische Werte außerhalb von NUMERIC_RANGES werden zu fehlenden Werten.
+
+    Nur Textwerte (str) werden verändert; andere Werte in gemischten Spalten bleiben erhalten.
+
+    Rückgabe: (bereinigter DataFrame, Bericht)
+    """
+    df = df.copy()
+    report = _empty_report(df.columns)
+
+    for col in _text_columns(df):
+        # Die Prüfung läuft nur auf den eindeutigen Werten, danach werden sie auf die Zeilen zurückgeführt
+        codes, uniques = pd.factorize(df[col])
+        uniques = pd.Series(uniques, dtype=object)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        # Gemischte Spalten (z. B. aus read_csv in Blöcken) können auch Zahlen enthalten
+        is_text = uniques.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        stripped = uniques.copy()
+        stripped[is_text] = uniques[is_text].str.strip()
+        placeholder = is_text & stripped.isin(PLACEHOLDER_TOKENS).to_numpy()
+        changed = is_text & (stripped != uniques).to_numpy() & ~placeholder
+        report[col]["whitespace"] = int(counts[changed].sum())
+        report[col]["placeholders"] = int(counts[placeholder].sum())
+
+        cleaned = stripped.mask(placeholder)
+        # Sind nach dem Entfernen der Platzhalter alle Werte Zahlen, wird die Spalte numerisch
+        numeric = pd.to_numeric(cleaned, errors="coerce")
+        if cleaned.notna().any() and (numeric.notna() == cleaned.notna()).all():
+            cleaned = numeric.astype(np.float64)
+        values = cleaned.to_numpy().take(codes)
+        values[codes < 0] = np.nan
+        df[col] = values
+
+    for col, (low, high) in NUMERIC_RANGES.items():
+        if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        invalid = pd.Series(False, index=df.index)
+        if low is not None:
+            invalid |= df[col] < low
+        if high is not None:
+            invalid |= df[col] > high
+        report[col]["out_of_range"] = int(invalid.sum())
+        df[col] = df[col].mask(invalid)
+
+    return df, report
+
+
+def harmonize_categories(df, report):
+    """
+    Fasst Kategorien zusammen, die sich nur in Groß-/Kleinschreibung unterscheiden.
+
+    Es wird jeweils die häufigste Schreibweise übernommen. Läuft nach dem Zusammenführen
+    der Blöcke, da erst dann die Häufigkeiten im gesamten Datensatz bekannt sind.
+    """
+    for col in _text_columns(df):
+        codes, uniques = pd.factorize(df[col])
+        if len(uniques) == 0:
+            continue
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        target = np.asarray(uniques, dtype=object).copy()
+        # Nur Textwerte werden verglichen, andere Werte bleiben unverändert
+        is_text = np.array([isinstance(value, str) for value in target], dtype=bool)
+        if not is_text.any():
+            continue
+        text = pd.Series(target[is_text])
+        keys = text.str.lower()
+        # Häufigste Schreibweise je Schlüssel bestimmen
+        canonical = pd.Series(counts[is_text]).groupby(keys.to_numpy()).idxmax()
+        target[is_text] = text.to_numpy()[keys.map(canonical).to_numpy()]
+        merged = is_text & (target != np.asarray(uniques, dtype=object))
+        if not merged.any():
+            continue
+        report[col]["merged_categories"] += int(counts[merged].sum())
+        values = target.take(codes)
+        values[codes < 0] = np.nan
+        df[col] = values
+    return df
+
+
+def scan_and_clean(csv_file, max_workers=None):
+    """
+    Liest die CSV-Datei ein und bereinigt sie in einem Durchlauf.
+
+    Große Dateien werden in Blöcken von CHUNK_ROWS Zeilen gelesen und auf einen Prozess-Pool verteilt.
+    Es werden höchstens so viele Blöcke gleichzeitig gelesen und übergeben, wie Worker vorhanden sind.
+
+    Rückgabe: (bereinigter DataFrame, Bericht)
+    """
+    if os.path.getsize(csv_file) < CHUNK_FILE_SIZE:
+        df, column_report = clean_chunk(pd.read_csv(csv_file))
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        parts = []
+        # Futures der Blöcke, die gerade bereinigt werden (in Lesereihenfolge)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pd.read_csv(csv_file, chunksize=CHUNK_ROWS):
+                # Erst den ältesten Block abholen, bevor ein weiterer Block übergeben wird
+                if len(pending) >= workers:
+                    parts.append(pending.popleft().result())
+                pending.append(pool.submit(clean_chunk, chunk))
+            parts.extend(future.result() for future in pending)
+        df = pd.concat([part for part, _ in parts], ignore_index=True)
+        column_report = _merge_reports([report for _, report in parts])
+
+    df = harmonize_categories(df, column_report)
+    for col, count in df.isnull().sum().items():
+        column_report[col]["missing"] = int(count)
+
+    stat = os.stat(csv_file)
+    report = {
+        "source": os.path.abspath(csv_file),
+        "source_size": stat.st_size,
+        "source_mtime": stat.st_mtime,
+        "cleaning_version": CLEANING_VERSION,
+        "rows": int(df.shape[0]),
+        "columns": column_report,
+    }
+    return df, report
+
+
+def cache_paths(csv_file):
+    """Gibt die Pfade der zwischengespeicherten Daten und des Qualitätsberichts zurück."""
+    base = os.path.splitext(csv_file)[0]
+    return base + ".clean.pkl", base + ".quality.json"
+
+
+def load_clean_data(csv_file):
+    """
+    Gibt die bereinigten Daten und den Qualitätsbericht zurück.
+
+    Wenn für die unveränderte CSV-Datei bereits mit denselben Regeln (CLEANING_VERSION) bereinigte
+    Daten gespeichert sind, werden diese geladen. Andernfalls wird die Datei geprüft, bereinigt und das Ergebnis gespeichert.
+    """
+    data_path, report_path = cache_paths(csv_file)
+    stat = os.stat(csv_file)
+
+    if os.path.exists(data_path) and os.path.exists(report_path):
+        try:
+            with open(report_path, encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            # Ein beschädigter Bericht wird wie ein fehlender Zwischenspeicher behandelt
+            report = {}
+        if (report.get("source_size") == stat.st_size and report.get("source_mtime") == stat.st_mtime
+                and report.get("cleaning_version") == CLEANING_VERSION):
+            return pd.read_pickle(data_path), report
+
+    df, report = scan_and_clean(csv_file)
+    df.to_pickle(data_path)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return df, report
+
+
+def report_summary(report):
+    """Fasst den Qualitätsbericht zu einem kurzen Text für die GUI zusammen."""
+    totals = dict.fromkeys(ISSUE_KEYS, 0)
+    for counts in report["columns"].values():
+        for key in ISSUE_KEYS:
+            totals[key] += counts[key]
+    return (
+        f"Placeholders: {totals['placeholders']}\n"
+        f"Whitespace Fixes: {totals['whitespace']}\n"
+        f"Out Of Range: {totals['out_of_range']}\n"
+        f"Merged Categories: {totals['merged_categories']}"
+    )
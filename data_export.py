@@ -0,0 +1,72 @@
+"""
+Blockweiser Export von DataFrames als CSV (optional gzip-komprimiert) oder Parquet.
+
+Funktionalitäten:
+- Schreiben in Blöcken von CHUNK_ROWS Zeilen, damit der Speicherbedarf begrenzt bleibt.
+- CSV-Dateien mit der Endung ".gz" werden gzip-komprimiert geschrieben.
+- Parquet-Dateien werden mit pyarrow geschrieben (optional, nur wenn pyarrow installiert ist).
+- Fortschrittsmeldung nach jedem Block, damit der Export im Hintergrund laufen kann.
+"""
+
+import gzip
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet-Export ist nur mit pyarrow möglich
+    pa = None
+    pq = None
+
+# Anzahl der Zeilen, die pro Block geschrieben werden
+CHUNK_ROWS = 500_000
+
+# Dateitypen für den Speichern-Dialog (Parquet nur, wenn pyarrow installiert ist)
+EXPORT_FILETYPES = [("CSV file", "*.csv"), ("Compressed CSV file", "*.csv.gz")]
+if pq is not None:
+    EXPORT_FILETYPES.append(("Parquet file", "*.parquet"))
+
+
+def _chunks(df, chunk_rows):
+    """Teilt den DataFrame in aufeinanderfolgende Zeilenblöcke."""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def export_csv(df, path, chunk_rows=CHUNK_ROWS, progress=None):
+    """Schreibt den DataFrame blockweise als CSV; bei der Endung ".gz" gzip-komprimiert."""
+    opener = gzip.open if path.endswith(".gz") else open
+    written = 0
+    with opener(path, "wt", encoding="utf-8", newline="") as f:
+        # Die Kopfzeile wird auch bei einem leeren DataFrame geschrieben
+        df.iloc[:0].to_csv(f, index=False)
+        for chunk in _chunks(df, chunk_rows):
+            chunk.to_csv(f, header=False, index=False)
+            written += len(chunk)
+            if progress is not None:
+                progress(written, len(df))
+
+
+def export_parquet(df, path, chunk_rows=CHUNK_ROWS, progress=None, compression="snappy"):
+    """Schreibt den DataFrame blockweise als Parquet-Datei (eine Row Group pro Block)."""
+    if pq is None:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    written = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            written += len(chunk)
+            if progress is not None:
+                progress(written, len(df))
+
+
+def export_frame(df, path, chunk_rows=CHUNK_ROWS, progress=None):
+    """
+    Exportiert den DataFrame abhängig von der Dateiendung als Parquet (".parquet") oder CSV.
+
+    `progress` wird nach jedem Block mit (geschriebene Zeilen, Gesamtzeilen) aufgerufen.
+    """
+    if path.endswith(".parquet"):
+        export_parquet(df, path, chunk_rows, progress)
+    else:
+        export_csv(df, path, chunk_rows, progress)
@@ -0,0 +1,65 @@
+"""
+Klasseneinteilung für Histogramme, gemeinsam genutzt von Diagramm und Export.
+
+Funktionalitäten:
+- Klassengrenzen, die zu den Daten passen:
+    Ganzzahlige Spalten (z. B. age, education-num) erhalten Klassen, die an ganzen Zahlen
+    ausgerichtet sind, sodass keine leeren Klassen oder Sägezahnmuster entstehen.
+    Andere Spalten verwenden np.histogram_bin_edges(..., bins="auto").
+- Zuordnung jeder Zeile zu ihrer Klasse und Häufigkeitstabelle je Klasse.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Höchstanzahl der Klassen, damit auch sehr breite Spalten (z. B. fnlwgt) übersichtlich bleiben
+MAX_HISTOGRAM_BINS = 100
+
+
+def histogram_edges(values):
+    """
+    Bestimmt die Klassengrenzen für die (nicht fehlenden) Werte.
+
+    Bei ganzzahligen Werten liegen die Grenzen auf halben Zahlen und jede Klasse umfasst gleich
+    viele ganze Zahlen (z. B. -0.5, 0.5, 1.5, ... für eine Klasse je Wert).
+    """
+    if values.size == 0:
+        return np.array([0.0, 1.0])
+    low, high = values.min(), values.max()
+
+    if np.all(values == np.round(values)):
+        n_values = int(high - low) + 1
+        auto_width = np.diff(np.histogram_bin_edges(values, bins="auto")[:2])[0] if high > low else 1
+        width = max(1, int(np.ceil(auto_width)), int(np.ceil(n_values / MAX_HISTOGRAM_BINS)))
+        n_bins = int(np.ceil(n_values / width))
+        return low - 0.5 + width * np.arange(n_bins + 1, dtype=np.float64)
+
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > MAX_HISTOGRAM_BINS:
+        edges = np.histogram_bin_edges(values, bins=MAX_HISTOGRAM_BINS)
+    return edges
+
+
+def histogram_codes(series):
+    """
+    Ordnet jede Zeile einer numerischen Spalte ihrer Klasse zu (fehlende Werte = -1).
+
+    Rückgabe: (codes, edges) mit den Klassengrenzen aus histogram_edges.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    edges = histogram_edges(values[valid])
+    codes = np.clip(np.digitize(values, edges) - 1, 0, len(edges) - 2)
+    codes[~valid] = -1
+    return codes, edges
+
+
+def histogram_table(series):
+    """
+    Gibt die Häufigkeiten je Klasse zurück, genau wie sie im Histogramm angezeigt werden.
+
+    Rückgabe: DataFrame mit "bin_left", "bin_right" und "Count".
+    """
+    codes, edges = histogram_codes(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(edges) - 1)
+    return pd.DataFrame({"bin_left": edges[:-1], "bin_right": edges[1:], "Count": counts})
@@ -0,0 +1,217 @@
+"""
+Berechnung von Zusammenhangsmaßen zwischen den Spalten des Census Income Datasets.
+
+Funktionalitäten:
+- Kodierung aller Spalten als ganzzahlige Codes (kategorische Spalten per Faktorisierung,
+  numerische Spalten per Quantil-Klassen).
+- Vektorisierte Kontingenztafeln über np.bincount auf den Codes.
+- Chi-Quadrat, Cramér's V und Mutual Information für alle Spaltenpaare.
+- Punktbiseriale Korrelation der numerischen Spalten mit der Zielspalte (z. B. "salary").
+- Verteilung der Spaltenpaare auf einen Prozess-Pool; die Codes liegen dabei einmal im
+  Shared Memory und werden nicht in jeden Worker kopiert.
+
+Die Funktionen arbeiten ohne GUI, damit sie in Worker-Prozessen importiert werden können.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+# Ab dieser Anzahl (Zeilen x Spaltenpaare) lohnt sich der Prozess-Pool
+PARALLEL_THRESHOLD = 5_000_000
+
+# Codes und Kategorienanzahl, die einmal pro Worker-Prozess gesetzt werden
+_shared_codes = None
+_shared_sizes = None
+# Referenz auf den Shared-Memory-Block, damit die Codes im Worker gültig bleiben
+_shared_block = None
+
+
+def encode_columns(df, bins=10, out=None):
+    """
+    Kodiert jede Spalte als ganzzahlige Codes (fehlende Werte = -1).
+
+    Kategorische Spalten werden faktorisiert, numerische Spalten in bis zu `bins`
+    Quantil-Klassen (bzw. gleich breite Klassen bei sehr schiefen Verteilungen) eingeteilt.
+
+    Mit `out` kann eine vorhandene int32-Matrix (z. B. im Shared Memory) übergeben werden,
+    in die die Codes direkt geschrieben werden.
+
+    Rückgabe: (codes, sizes) mit codes als Matrix (Spalten x Zeilen) und sizes als
+    Anzahl der Kategorien je Spalte.
+    """
+    codes = np.empty((df.shape[1], df.shape[0]), dtype=np.int32) if out is None else out
+    sizes = np.empty(df.shape[1], dtype=np.int64)
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) and series.nunique() > bins:
+            col_codes = pd.qcut(series, q=bins, labels=False, duplicates="drop")
+            # Stark schiefe Spalten (z. B. capital-gain) fallen zu einer Klasse zusammen,
+            # dann werden gleich breite Klassen verwendet
+            if col_codes.nunique() < 2:
+                col_codes = pd.cut(series, bins=bins, labels=False)
+            col_codes = col_codes.fillna(-1).to_numpy(dtype=np.int32)
+        else:
+            col_codes, _ = pd.factorize(series, sort=True)
+        codes[i] = col_codes
+        sizes[i] = col_codes.max() + 1 if len(col_codes) else 0
+    return codes, sizes
+
+
+def contingency_table(codes_a, codes_b, size_a, size_b):
+    """Erstellt die Kontingenztafel zweier Code-Vektoren mit einem einzigen bincount."""
+    mask = (codes_a >= 0) & (codes_b >= 0)
+    flat = codes_a[mask].astype(np.int64) * size_b + codes_b[mask]
+    table = np.bincount(flat, minlength=size_a * size_b).reshape(size_a, size_b)
+    # Leere Zeilen und Spalten entfernen, damit die erwarteten Häufigkeiten > 0 sind
+    return table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+
+
+def table_measures(table):
+    """
+    Berechnet Chi-Quadrat, Cramér's V und Mutual Information (in nats) aus einer Kontingenztafel.
+    """
+    n = table.sum()
+    if n == 0 or min(table.shape) < 2:
+        return 0.0, 0.0, 0.0
+    observed = table.astype(np.float64)
+    row_sums = observed.sum(axis=1, keepdims=True)
+    col_sums = observed.sum(axis=0, keepdims=True)
+    expected = row_sums @ col_sums / n
+    chi2 = ((observed - expected) ** 2 / expected).sum()
+    cramers_v = np.sqrt(chi2 / n / (min(table.shape) - 1))
+
+    nonzero = observed > 0
+    p_xy = observed[nonzero] / n
+    mutual_info = (p_xy * np.log(observed[nonzero] * n / (row_sums @ col_sums)[nonzero])).sum()
+    return float(chi2), float(cramers_v), float(mutual_info)
+
+
+def _init_worker(codes, sizes):
+    """Legt die kodierten Spalten einmalig im Prozess ab (ohne Prozess-Pool)."""
+    global _shared_codes, _shared_sizes
+    _shared_codes = codes
+    _shared_sizes = sizes
+
+
+def _attach_worker(block_name, shape, sizes):
+    """Verbindet den Worker mit dem Shared-Memory-Block der Codes, ohne sie zu kopieren."""
+    global _shared_block
+    try:
+        # Ab Python 3.13: der Worker soll den Block beim Beenden nicht freigeben
+        _shared_block = shared_memory.SharedMemory(name=block_name, track=False)
+    except TypeError:
+        _shared_block = shared_memory.SharedMemory(name=block_name)
+    _init_worker(np.ndarray(shape, dtype=np.int32, buffer=_shared_block.buf), sizes)
+
+
+def _measure_pairs(pairs):
+    """Berechnet die Maße für eine Liste von Spaltenindex-Paaren (läuft im Worker)."""
+    results = []
+    for i, j in pairs:
+        table = contingency_table(_shared_codes[i], _shared_codes[j], _shared_sizes[i], _shared_sizes[j])
+        results.append((i, j) + table_measures(table))
+    return results
+
+
+def pairwise_associations(df, bins=10, max_workers=None):
+    """
+    Berechnet Chi-Quadrat, Cramér's V und Mutual Information für alle Spaltenpaare.
+
+    Bei großen Datensätzen werden die Paare blockweise auf einen Prozess-Pool verteilt. Die Codes
+    werden dafür direkt in einen Shared-Memory-Block geschrieben, den alle Worker gemeinsam lesen.
+
+    Rückgabe: DataFrame mit den Spalten "column_1", "column_2", "chi2", "cramers_v", "mutual_info".
+    """
+    pairs = list(combinations(range(df.shape[1]), 2))
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers > 1 and df.shape[0] * len(pairs) >= PARALLEL_THRESHOLD:
+        shape = (df.shape[1], df.shape[0])
+        block = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 4))
+        codes = None
+        try:
+            codes, sizes = encode_columns(df, bins, out=np.ndarray(shape, dtype=np.int32, buffer=block.buf))
+            blocks = [pairs[k::workers] for k in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                     initargs=(block.name, shape, sizes)) as pool:
+                # Wieder in die Reihenfolge der Spaltenpaare bringen
+                results = sorted(row for part in pool.map(_measure_pairs, blocks) for row in part)
+        finally:
+            # Die Ansicht auf den Puffer muss vor dem Schließen freigegeben werden
+            codes = None
+            try:
+                block.close()
+            except BufferError:
+                # Bei einem Fehler kann der Traceback noch auf den Puffer verweisen
+                pass
+            # Der Block wird in jedem Fall freigegeben, damit kein Shared Memory zurückbleibt
+            block.unlink()
+    else:
+        codes, sizes = encode_columns(df, bins)
+        _init_worker(codes, sizes)
+        results = _measure_pairs(pairs)
+
+    columns = df.columns
+    return pd.DataFrame(
+        [(columns[i], columns[j], chi2, v, mi) for i, j, chi2, v, mi in results],
+        columns=["column_1", "column_2", "chi2", "cramers_v", "mutual_info"],
+    )
+
+
+def association_matrix(pairs_df, measure="cramers_v"):
+    """Wandelt die Paarliste in eine symmetrische Matrix für eine Heatmap um."""
+    names = pd.unique(pairs_df[["column_1", "column_2"]].to_numpy().ravel())
+    matrix = pd.DataFrame(np.eye(len(names)), index=names, columns=names)
+    for col_1, col_2, value in pairs_df[["column_1", "column_2", measure]].itertuples(index=False):
+        matrix.loc[col_1, col_2] = value
+        matrix.loc[col_2, col_1] = value
+    return matrix
+
+
+def point_biserial(df, target="salary"):
+    """
+    Berechnet die punktbiseriale Korrelation jeder numerischen Spalte mit einer binären Zielspalte.
+
+    Die Zielspalte wird sortiert faktorisiert, die zweite Kategorie (z. B. ">50K") zählt als 1.
+    Für jede Spalte werden nur die Zeilen ohne fehlende Werte berücksichtigt.
+    """
+    target_codes, uniques = pd.factorize(df[target], sort=True)
+    numeric = df.select_dtypes(include="number")
+    if len(uniques) != 2 or numeric.empty:
+        return pd.Series(dtype=float)
+
+    y_all = target_codes.astype(np.float64)
+    r = np.full(numeric.shape[1], np.nan)
+    for k, col in enumerate(numeric.columns):
+        # Nur Zeilen verwenden, in denen Merkmal und Zielspalte vorhanden sind
+        x = numeric[col].to_numpy(dtype=np.float64)
+        valid = (target_codes >= 0) & ~np.isnan(x)
+        x_centered = x[valid] - x[valid].mean()
+        y_centered = y_all[valid] - y_all[valid].mean()
+        denominator = np.sqrt((x_centered ** 2).sum() * (y_centered ** 2).sum())
+        if denominator > 0:
+            r[k] = (x_centered * y_centered).sum() / denominator
+    return pd.Series(r, index=numeric.columns)
+
+
+def salary_ranking(df, target="salary", pairs_df=None, bins=10, max_workers=None):
+    """
+    Rangliste aller Merkmale nach ihrem Zusammenhang mit der Zielspalte.
+
+    Rückgabe: DataFrame mit "feature", "chi2", "cramers_v", "mutual_info" und "point_biserial",
+    absteigend nach Cramér's V sortiert.
+    """
+    if pairs_df is None:
+        pairs_df = pairwise_associations(df, bins=bins, max_workers=max_workers)
+    against_target = pairs_df[(pairs_df["column_1"] == target) | (pairs_df["column_2"] == target)].copy()
+    against_target["feature"] = against_target["column_1"].where(
+        against_target["column_2"] == target, against_target["column_2"]
+    )
+    ranking = against_target[["feature", "chi2", "cramers_v", "mutual_info"]].set_index("feature")
+    ranking["point_biserial"] = point_biserial(df, target)
+    return ranking.sort_values("cramers_v", ascending=False).reset_index()
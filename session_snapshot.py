@@ -0,0 +1,142 @@
+"""
+Speichern und Wiederherstellen des Arbeitsstands der Anwendung zwischen zwei Starts.
+
+Funktionalitäten:
+- Speicherung der abgeleiteten Spalten (z. B. education_level) im Binärformat; die bereinigten
+  Daten selbst liegen bereits im Zwischenspeicher von data_cleaning.
+- Zwischenspeicherung der bereits erstellten Diagramme als Plotly-JSON, damit sie nicht neu berechnet werden
+  (nur Diagramme aus vorberechneten Kennzahlen, keine Diagramme mit allen Rohdaten).
+- Speicherung der letzten Auswahl in der GUI (Diagrammtyp, Spalten, Kennzahl).
+- Der Arbeitsstand gilt nur, solange die CSV-Datei und der Fingerabdruck der Verarbeitung
+  (Zuordnungsfunktionen, Bereinigungsregeln) unverändert sind.
+
+Aufbau des Ordners "<csv>.session":
+    derived.pkl    abgeleitete Spalten
+    state.json     Auswahl, Fingerabdruck und Liste der gespeicherten Diagramme
+    figures/       Diagramme als Plotly-JSON, benannt nach einem Hash der Auswahl
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+
+import pandas as pd
+import plotly.io as pio
+
+# Maximale Anzahl gespeicherter Diagramme (die ältesten werden zuerst gelöscht)
+MAX_FIGURES = 20
+
+
+def code_fingerprint(*sources, version=None):
+    """
+    Bildet einen Fingerabdruck aus dem Quelltext der übergebenen Funktionen oder Module und einer Versionsnummer.
+
+    Ändert sich eine Zuordnungsfunktion, ein Modul der Diagrammerstellung (einschließlich seiner
+    Konstanten) oder die Version der Bereinigung, ändert sich auch der Fingerabdruck.
+    """
+    text = "".join(inspect.getsource(source) for source in sources) + str(version)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def selection_key(selection):
+    """Bildet aus einer Auswahl (Diagrammtyp, Spalten, ...) einen eindeutigen Dateinamen."""
+    text = json.dumps(selection, sort_keys=True)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()[:16] + ".json"
+
+
+class SessionSnapshot:
+    """
+    Verwaltet den gespeicherten Arbeitsstand für eine CSV-Datei.
+
+    Methoden:
+    ---------
+    load_derived(n_rows): Gibt die gespeicherten abgeleiteten Spalten zurück (oder None).
+    save_derived(derived): Speichert die abgeleiteten Spalten.
+    load_figure(selection): Gibt das gespeicherte Diagramm zu einer Auswahl zurück (oder None).
+    save_figure(selection, fig): Speichert ein Diagramm und merkt sich die Auswahl als letzte Auswahl.
+    save_selection(selection): Merkt sich die Auswahl als letzte Auswahl, ohne ein Diagramm zu speichern.
+    last_selection(): Gibt die zuletzt verwendete Auswahl zurück (oder None).
+    """
+    def __init__(self, csv_file, fingerprint):
+        # Ordner für den Arbeitsstand neben der CSV-Datei
+        self.path = os.path.splitext(csv_file)[0] + ".session"
+        self.derived_path = os.path.join(self.path, "derived.pkl")
+        self.state_path = os.path.join(self.path, "state.json")
+        self.figure_dir = os.path.join(self.path, "figures")
+
+        stat = os.stat(csv_file)
+        self.source = {"source_size": stat.st_size, "source_mtime": stat.st_mtime, "fingerprint": fingerprint}
+        self.state = self._read_state()
+
+    def _read_state(self):
+        """
+        Liest state.json. Ein Arbeitsstand zu einer geänderten CSV-Datei oder Verarbeitung wird
+        verworfen, ebenso eine beschädigte Datei.
+        """
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+            if isinstance(state, dict) and all(state.get(key) == value for key, value in self.source.items()):
+                return state
+        return dict(self.source, figures=[], selection=None, derived=False)
+
+    def _write_state(self):
+        """Schreibt state.json."""
+        os.makedirs(self.path, exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+
+    def load_derived(self, n_rows):
+        """Gibt die abgeleiteten Spalten zurück oder None, falls nicht vorhanden oder nicht passend."""
+        if not self.state.get("derived") or not os.path.exists(self.derived_path):
+            return None
+        derived = pd.read_pickle(self.derived_path)
+        return derived if len(derived) == n_rows else None
+
+    def save_derived(self, derived):
+        """Speichert die abgeleiteten Spalten."""
+        os.makedirs(self.path, exist_ok=True)
+        derived.to_pickle(self.derived_path, protocol=pickle.HIGHEST_PROTOCOL)
+        self.state["derived"] = True
+        self._write_state()
+
+    def load_figure(self, selection):
+        """Gibt das gespeicherte Diagramm zu einer Auswahl zurück oder None."""
+        name = selection_key(selection)
+        path = os.path.join(self.figure_dir, name)
+        if name not in self.state["figures"] or not os.path.exists(path):
+            return None
+        return pio.read_json(path)
+
+    def save_figure(self, selection, fig):
+        """Speichert das Diagramm zu einer Auswahl und merkt sich die Auswahl als letzte Auswahl."""
+        os.makedirs(self.figure_dir, exist_ok=True)
+        name = selection_key(selection)
+        if name in self.state["figures"]:
+            self.state["figures"].remove(name)
+        else:
+            fig.write_json(os.path.join(self.figure_dir, name))
+        self.state["figures"].append(name)
+
+        # Älteste Diagramme löschen, wenn zu viele gespeichert sind
+        while len(self.state["figures"]) > MAX_FIGURES:
+            old_path = os.path.join(self.figure_dir, self.state["figures"].pop(0))
+            if os.path.exists(old_path):
+                os.remove(old_path)
+
+        self.state["selection"] = selection
+        self._write_state()
+
+    def save_selection(self, selection):
+        """Merkt sich die Auswahl als letzte Auswahl, ohne ein Diagramm zu speichern."""
+        self.state["selection"] = selection
+        self._write_state()
+
+    def last_selection(self):
+        """Gibt die zuletzt verwendete Auswahl zurück oder None."""
+        return self.state["selection"]